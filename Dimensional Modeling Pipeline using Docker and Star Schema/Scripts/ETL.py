@@ -1,13 +1,101 @@
+import numpy as np
 import pandas as pd
-import mysql.connector
+import pyarrow as pa
+import pyarrow.csv as pac
+import pyarrow.parquet as pq
+import MySQLdb
+import csv
+import functools
+import hashlib
+import itertools
 import os
-from typing import Optional
+import queue
+import shutil
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, Optional
 
 DB_HOST = os.environ.get('DB_HOST')
 DB_USER = os.environ.get('DB_USER')
 DB_PASSWORD = os.environ.get('DB_PASSWORD')
 DB_NAME = os.environ.get('DB_NAME')
+FULL_RELOAD = os.environ.get('FULL_RELOAD') == '1'
 RAW_DATA_PATH = '/app/data/shopping_trends.csv'
+CACHE_DIR = os.environ.get('ETL_CACHE_DIR', '/tmp/etl_cache')
+# Bump when the normalization logic changes so stale Parquet caches are ignored.
+CACHE_VERSION = 1
+INSERT_CHUNK_SIZE = 1000
+CSV_BLOCK_SIZE = 4 << 20
+POOL_SIZE = 4
+LOAD_WORKERS = POOL_SIZE - 1
+
+RAW_COLUMNS = [
+    'Customer ID',
+    'Age',
+    'Gender',
+    'Item Purchased',
+    'Category',
+    'Purchase Amount (USD)',
+    'Location',
+    'Size',
+    'Color',
+    'Season',
+    'Review Rating',
+    'Subscription Status',
+    'Payment Method',
+    'Shipping Type',
+    'Discount Applied',
+    'Promo Code Used',
+    'Previous Purchases',
+    'Preferred Payment Method',
+    'Frequency of Purchases'
+]
+
+# Maps every byte outside [A-Za-z0-9_] to '_' so header cleanup is a single
+# C-level str.translate instead of a regex substitution.
+_NAME_TRANSLATION = {c: '_' for c in range(256) if not ((chr(c).isascii() and chr(c).isalnum()) or chr(c) == '_')}
+
+def normalize_column_name(name: str) -> str:
+    return '_'.join(part for part in name.lower().translate(_NAME_TRANSLATION).split('_') if part)
+
+COLUMN_RENAME = {raw: normalize_column_name(raw) for raw in RAW_COLUMNS}
+
+COLUMN_TYPES = {
+    'customer_id': pa.int32(),
+    'age': pa.int16(),
+    'gender': pa.string(),
+    'item_purchased': pa.string(),
+    'category': pa.string(),
+    'purchase_amount_usd': pa.float64(),
+    'location': pa.string(),
+    'size': pa.string(),
+    'color': pa.string(),
+    'season': pa.string(),
+    'review_rating': pa.float64(),
+    'subscription_status': pa.string(),
+    'shipping_type': pa.string(),
+    'discount_applied': pa.string(),
+    'promo_code_used': pa.string(),
+    'previous_purchases': pa.int16(),
+    'preferred_payment_method': pa.string(),
+    'frequency_of_purchases': pa.string()
+}
+
+CATEGORICAL_COLUMNS = [
+    'gender', 'item_purchased', 'category', 'location', 'size', 'color', 'season',
+    'subscription_status', 'shipping_type', 'discount_applied', 'promo_code_used',
+    'preferred_payment_method', 'frequency_of_purchases'
+]
+
+LOAD_COLUMN_RENAME = {
+    'item_purchased': 'item_name',
+    'preferred_payment_method': 'payment_method'
+}
+
+LOAD_COLUMN_TYPES = {
+    'purchase_transaction_id': pa.int32(),
+    **{LOAD_COLUMN_RENAME.get(col, col): col_type for col, col_type in COLUMN_TYPES.items()}
+}
 
 TABLES = {
     'customer': 'Dim_Customer',
@@ -15,10 +103,30 @@ TABLES = {
     'purchase': 'Fact_Purchase'
 }
 
+TABLE_SCHEMA = {
+    'Dim_Customer': ['customer_id', 'age', 'gender', 'location', 'subscription_status', 'frequency_of_purchases'],
+    'Dim_Item': ['item_name', 'category', 'size', 'color', 'season'],
+    'Fact_Purchase': ['purchase_transaction_id', 'customer_id', 'item_name', 'category',
+                      'purchase_amount_usd', 'review_rating', 'shipping_type', 'discount_applied',
+                      'promo_code_used', 'previous_purchases', 'payment_method']
+}
+
+FACT_ARROW_SCHEMA = pa.schema([
+    (col, pa.dictionary(pa.int32(), LOAD_COLUMN_TYPES[col])
+     if col in {LOAD_COLUMN_RENAME.get(c, c) for c in CATEGORICAL_COLUMNS} else LOAD_COLUMN_TYPES[col])
+    for col in TABLE_SCHEMA['Fact_Purchase']
+])
+
+TABLE_KEYS = {
+    'Dim_Customer': ['customer_id'],
+    'Dim_Item': ['item_name', 'category'],
+    'Fact_Purchase': ['purchase_transaction_id']
+}
+
 def get_create_table_queries():
     return [
         """
-        CREATE TABLE Dim_Customer (
+        CREATE TABLE IF NOT EXISTS Dim_Customer (
             customer_id INT NOT NULL,
             age INT,
             gender VARCHAR(10),
@@ -29,7 +137,7 @@ def get_create_table_queries():
         );
         """,
         """
-        CREATE TABLE Dim_Item (
+        CREATE TABLE IF NOT EXISTS Dim_Item (
             item_name VARCHAR(50) NOT NULL,
             category VARCHAR(50) NOT NULL,
             size VARCHAR(5),
@@ -39,7 +147,7 @@ def get_create_table_queries():
         );
         """,
         """
-        CREATE TABLE Fact_Purchase (
+        CREATE TABLE IF NOT EXISTS Fact_Purchase (
             purchase_transaction_id INT NOT NULL,
             customer_id INT NOT NULL,
             item_name VARCHAR(50) NOT NULL,
@@ -51,41 +159,214 @@ def get_create_table_queries():
             discount_applied VARCHAR(5),
             promo_code_used VARCHAR(5),
             previous_purchases INT,
-            PRIMARY KEY (purchase_transaction_id),
-            FOREIGN KEY (customer_id) REFERENCES Dim_Customer(customer_id),
-            FOREIGN KEY (item_name, category) REFERENCES Dim_Item(item_name, category)
+            PRIMARY KEY (purchase_transaction_id)
         );
         """
     ]
 
-def read_and_normalize_data(file_path: str) -> Optional[dict]:
-    print("1. Starting data reading and normalization...")
-    try:
-        df = pd.read_csv(file_path)
-        df.columns = df.columns.str.lower().str.replace('[^a-z0-9_]+', '_', regex=True)
-        df.rename(columns={'purchase_amount_usd_': 'purchase_amount_usd'}, inplace=True)
-        df['purchase_transaction_id'] = df.index
+def get_post_load_constraint_queries():
+    # Keyed by the foreign key columns, so keys created under other names
+    # (e.g. the auto-named Fact_Purchase_ibfk_* of older tables) are reused.
+    return {
+        ('customer_id',): """
+        ALTER TABLE Fact_Purchase
+            ADD CONSTRAINT fk_purchase_customer
+            FOREIGN KEY (customer_id) REFERENCES Dim_Customer(customer_id);
+        """,
+        ('item_name', 'category'): """
+        ALTER TABLE Fact_Purchase
+            ADD CONSTRAINT fk_purchase_item
+            FOREIGN KEY (item_name, category) REFERENCES Dim_Item(item_name, category);
+        """
+    }
+
+def first_occurrence_index(keys: np.ndarray) -> np.ndarray:
+    _, first_idx = np.unique(keys, return_index=True)
+    first_idx.sort()
+    return first_idx
+
+def row_count(columns: dict) -> int:
+    return len(next(iter(columns.values())))
+
+def take_new_dim_rows(df: pd.DataFrame, table_name: str, first_idx: np.ndarray, keys: list, seen: set) -> dict:
+    is_new = np.array([key not in seen for key in keys], dtype=bool)
+    seen.update(keys)
+    rows = first_idx[is_new]
+    return {col: df[col].take(rows).to_numpy(dtype=object, na_value=None) for col in TABLE_SCHEMA[table_name]}
+
+def normalize_chunk(df: pd.DataFrame, seen_customers: set, seen_items: set) -> dict:
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+    df['purchase_transaction_id'] = np.arange(df.index.start, df.index.stop, dtype=np.int32)
+    df.rename(columns=LOAD_COLUMN_RENAME, inplace=True)
+
+    customer_idx = first_occurrence_index(df['customer_id'].to_numpy())
+    customer_keys = df['customer_id'].to_numpy()[customer_idx].tolist()
+    dim_customer = take_new_dim_rows(df, 'Dim_Customer', customer_idx, customer_keys, seen_customers)
+
+    item_key = (df['item_name'].cat.codes.to_numpy().astype(np.int64) * len(df['category'].cat.categories)
+                + df['category'].cat.codes.to_numpy())
+    item_idx = first_occurrence_index(item_key)
+    item_keys = list(zip(df['item_name'].take(item_idx), df['category'].take(item_idx)))
+    dim_item = take_new_dim_rows(df, 'Dim_Item', item_idx, item_keys, seen_items)
+
+    # The loaders only read the TABLE_SCHEMA columns, so the fact table is
+    # the block frame itself rather than a copied column subset.
+    return {
+        'Dim_Customer': dim_customer,
+        'Dim_Item': dim_item,
+        'Fact_Purchase': df
+    }
+
+def iter_normalized_chunks(reader) -> Iterator[dict]:
+    seen_customers = set()
+    seen_items = set()
+    offset = 0
+    for batch in reader:
+        df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+        df.index = pd.RangeIndex(offset, offset + len(df))
+        offset += len(df)
+
+        chunk = normalize_chunk(df, seen_customers, seen_items)
+        print(f"   -> Normalized {len(df)} rows: {row_count(chunk['Dim_Customer'])} new customers, "
+              f"{row_count(chunk['Dim_Item'])} new items.")
+        yield chunk
+
+def file_digest(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+def cache_key(file_path: str) -> str:
+    # Schema changes alter the layout token, so old cache entries never match.
+    layout = repr((CACHE_VERSION, TABLE_SCHEMA, str(FACT_ARROW_SCHEMA),
+                   {col: str(col_type) for col, col_type in LOAD_COLUMN_TYPES.items()}))
+    layout_token = hashlib.sha256(layout.encode()).hexdigest()[:8]
+    return f"{file_digest(file_path)}-{layout_token}"
 
-        dim_customer = df[['customer_id', 'age', 'gender', 'location', 'subscription_status', 'frequency_of_purchases']].drop_duplicates(subset=['customer_id'])
-        print(f"   -> Dim_Customer size: {len(dim_customer)}")
+def cache_paths(cache_dir: str) -> dict:
+    return {table_name: os.path.join(cache_dir, f"{table_name}.parquet") for table_name in TABLE_SCHEMA}
 
-        dim_item = df[['item_purchased', 'category', 'size', 'color', 'season']].drop_duplicates(subset=['item_purchased', 'category'])
-        dim_item.rename(columns={'item_purchased': 'item_name'}, inplace=True)
-        print(f"   -> Dim_Item size: {len(dim_item)}")
+def open_cache(cache_dir: str) -> tuple:
+    paths = cache_paths(cache_dir)
+    fact_file = pq.ParquetFile(paths[TABLES['purchase']])
+    if not fact_file.schema_arrow.equals(FACT_ARROW_SCHEMA):
+        raise pa.ArrowInvalid(f"unexpected schema in {paths[TABLES['purchase']]}")
+    dims = {}
+    for table_name in (TABLES['customer'], TABLES['item']):
+        table = pq.read_table(paths[table_name], columns=TABLE_SCHEMA[table_name])
+        dims[table_name] = {col: np.array(table.column(col).to_pylist(), dtype=object) for col in TABLE_SCHEMA[table_name]}
+    return dims, fact_file
 
-        fact_purchase = df[['purchase_transaction_id', 'customer_id', 'item_purchased', 'category',
-                            'purchase_amount_usd', 'review_rating', 'shipping_type', 'discount_applied',
-                            'promo_code_used', 'previous_purchases', 'preferred_payment_method']].copy()
+def iter_cached_chunks(dims: dict, fact_file: pq.ParquetFile) -> Iterator[dict]:
+    empty_dims = {
+        table_name: {col: np.empty(0, dtype=object) for col in TABLE_SCHEMA[table_name]} for table_name in dims
+    }
 
-        fact_purchase.rename(columns={'item_purchased': 'item_name', 'preferred_payment_method': 'payment_method'}, inplace=True)
+    # Dimensions ride along with the first fact batch; later batches carry none.
+    for batch in fact_file.iter_batches():
+        chunk = dict(dims)
+        # Dictionary columns come back as categoricals; nullable ints stay ints.
+        chunk[TABLES['purchase']] = batch.to_pandas(
+            types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t)
+        )
+        dims = empty_dims
+        yield chunk
+
+def write_dim_cache(dim_parts: dict, paths: dict):
+    for table_name, parts in dim_parts.items():
+        dim = pa.table({
+            col: pa.array(
+                np.concatenate([part[col] for part in parts]) if parts else [],
+                type=LOAD_COLUMN_TYPES[col], from_pandas=True
+            )
+            for col in TABLE_SCHEMA[table_name]
+        })
+        pq.write_table(dim, paths[table_name], compression='zstd')
+
+def iter_caching_chunks(chunks: Iterator[dict], cache_dir: str) -> Iterator[dict]:
+    # Caching is best-effort: any failure to write it is logged and the
+    # partial cache is discarded, but the chunks keep flowing to the loader.
+    partial_dir = f"{cache_dir}.partial"
+    paths = cache_paths(partial_dir)
+    dim_parts = {TABLES['customer']: [], TABLES['item']: []}
+    fact_cols = TABLE_SCHEMA[TABLES['purchase']]
+    writer = None
+    try:
+        os.makedirs(partial_dir, exist_ok=True)
+        writer = pq.ParquetWriter(paths[TABLES['purchase']], FACT_ARROW_SCHEMA, compression='zstd')
+    except (OSError, pa.ArrowException) as err:
+        print(f"   -> Warning: could not start the Parquet cache: {err}")
+
+    completed = False
+    try:
+        for chunk in chunks:
+            if writer is not None:
+                try:
+                    fact = pa.Table.from_pandas(chunk[TABLES['purchase']][fact_cols], preserve_index=False)
+                    writer.write_table(fact.cast(FACT_ARROW_SCHEMA))
+                    for table_name, parts in dim_parts.items():
+                        parts.append(chunk[table_name])
+                except (OSError, pa.ArrowException) as err:
+                    print(f"   -> Warning: could not write the Parquet cache: {err}")
+                    writer.close()
+                    writer = None
+            yield chunk
+        completed = True
+    finally:
+        cached = False
+        if writer is not None:
+            try:
+                writer.close()
+                if completed:
+                    write_dim_cache(dim_parts, paths)
+                    os.replace(partial_dir, cache_dir)
+                    cached = True
+                    print(f"   -> Cached normalized tables in {cache_dir}")
+            except (OSError, pa.ArrowException) as err:
+                print(f"   -> Warning: could not write the Parquet cache: {err}")
+        if not cached:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+
+def check_header(file_path: str):
+    # Columns are named by position from COLUMN_RENAME, so a reordered or
+    # extended export must fail here instead of loading into the wrong columns.
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        header = next(csv.reader(f), [])
+    if header != RAW_COLUMNS:
+        raise ValueError(f"Unexpected CSV header {header}, expected {RAW_COLUMNS}")
 
-        print(f"Data normalized. Fact table size: {len(fact_purchase)} rows.")
+def read_and_normalize_data(file_path: str) -> Optional[Iterator[dict]]:
+    print("1. Starting data reading and normalization...")
+    try:
+        cache_dir = os.path.join(CACHE_DIR, cache_key(file_path))
+        if os.path.isdir(cache_dir):
+            # Open every cache file up front so a damaged entry is dropped and
+            # rebuilt from the CSV before anything touches the database.
+            try:
+                dims, fact_file = open_cache(cache_dir)
+            except (OSError, pa.ArrowException) as err:
+                print(f"   -> Warning: discarding unreadable cache {cache_dir}: {err}")
+                shutil.rmtree(cache_dir, ignore_errors=True)
+            else:
+                print(f"   -> Reading cached normalized tables from {cache_dir}")
+                return iter_cached_chunks(dims, fact_file)
 
-        return {
-            'Dim_Customer': dim_customer,
-            'Dim_Item': dim_item,
-            'Fact_Purchase': fact_purchase
-        }
+        check_header(file_path)
+        reader = pac.open_csv(
+            file_path,
+            read_options=pac.ReadOptions(
+                use_threads=True, block_size=CSV_BLOCK_SIZE,
+                column_names=list(COLUMN_RENAME.values()), skip_rows=1
+            ),
+            convert_options=pac.ConvertOptions(
+                include_columns=list(COLUMN_TYPES),
+                column_types=COLUMN_TYPES
+            )
+        )
+        return iter_caching_chunks(iter_normalized_chunks(reader), cache_dir)
 
     except FileNotFoundError:
         print(f"Error: Input file not found at {file_path}")
@@ -94,47 +375,173 @@ def read_and_normalize_data(file_path: str) -> Optional[dict]:
         print(f"An error occurred during data normalization: {e}")
         return None
 
-def setup_database(cursor):
+def ensure_schema(cursor):
     print("2. Setting up target tables...")
-    drop_order = [TABLES['purchase'], TABLES['customer'], TABLES['item']]
-    for table_name in drop_order:
-        try:
-            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-        except Exception as e:
-            print(f"Could not drop table {table_name}: {e}")
-
     for query in get_create_table_queries():
         cursor.execute(query)
-    print("All tables created successfully.")
+    print("All tables are in place.")
 
-def load_data(data_dict: dict):
+def truncate_all(cursor):
+    print("2. Full reload requested, truncating target tables...")
+    cursor.execute("SET foreign_key_checks = 0")
+    truncate_order = [TABLES['purchase'], TABLES['customer'], TABLES['item']]
+    for table_name in truncate_order:
+        cursor.execute(f"TRUNCATE TABLE {table_name}")
+    cursor.execute("SET foreign_key_checks = 1")
+    print("All tables truncated successfully.")
+
+def add_constraints(cursor):
+    print("4. Adding foreign keys to loaded tables...")
+    cursor.execute(
+        "SELECT CONSTRAINT_NAME, COLUMN_NAME FROM information_schema.KEY_COLUMN_USAGE "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND REFERENCED_TABLE_NAME IS NOT NULL "
+        "ORDER BY CONSTRAINT_NAME, ORDINAL_POSITION",
+        (TABLES['purchase'],)
+    )
+    constraint_columns = {}
+    for name, column in cursor.fetchall():
+        constraint_columns.setdefault(name, []).append(column)
+    existing = {tuple(columns) for columns in constraint_columns.values()}
+    for columns, query in get_post_load_constraint_queries().items():
+        if columns not in existing:
+            cursor.execute(query)
+    print("All constraints are in place.")
+
+@functools.lru_cache(maxsize=None)
+def get_insert_template(table_name: str, row_count: int) -> str:
+    cols = TABLE_SCHEMA[table_name]
+    row_placeholder = "(" + ", ".join(["%s"] * len(cols)) + ")"
+    updates = ", ".join(f"{col} = new.{col}" for col in cols if col not in TABLE_KEYS[table_name])
+    return (f"INSERT INTO {table_name} ({', '.join(cols)}) VALUES " + ", ".join([row_placeholder] * row_count)
+            + f" AS new ON DUPLICATE KEY UPDATE {updates}")
+
+INSERT_TEMPLATES = {
+    table_name: get_insert_template(table_name, INSERT_CHUNK_SIZE) for table_name in TABLE_SCHEMA
+}
+
+def pack_rows(columns, cols: list):
+    # Object arrays hand the driver plain Python scalars rather than numpy ones.
+    return zip(*[np.asarray(columns[col], dtype=object) for col in cols])
+
+def iter_chunks(rows, size: int) -> Iterator[list]:
+    rows = iter(rows)
+    return iter(lambda: list(itertools.islice(rows, size)), [])
+
+def bulk_insert(cursor, table_name: str, rows) -> int:
+    total = 0
+    for chunk in iter_chunks(rows, INSERT_CHUNK_SIZE):
+        if len(chunk) == INSERT_CHUNK_SIZE:
+            insert_query = INSERT_TEMPLATES[table_name]
+        else:
+            insert_query = get_insert_template(table_name, len(chunk))
+        cursor.execute(insert_query, list(itertools.chain.from_iterable(chunk)))
+        total += len(chunk)
+    return total
+
+def load_data_infile(cursor, table_name: str, df: pd.DataFrame) -> int:
+    cols = TABLE_SCHEMA[table_name]
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False, newline='') as tmp:
+        df.to_csv(tmp, columns=cols, index=False, header=False, sep='\t', na_rep='\\N', lineterminator='\n')
+        tmp_path = tmp.name
     try:
-        conn = mysql.connector.connect(
-            host=DB_HOST, user=DB_USER, password=DB_PASSWORD, database=DB_NAME
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE {table_name} "
+            "FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+            f"({', '.join(cols)})",
+            (tmp_path,)
         )
+    finally:
+        os.remove(tmp_path)
+    return len(df)
+
+def start_bulk_session(cursor):
+    cursor.execute("SET foreign_key_checks = 0")
+    cursor.execute("SET unique_checks = 0")
+    cursor.execute("SET autocommit = 0")
+
+def open_connection_pool(size: int) -> queue.Queue:
+    pool = queue.Queue()
+    try:
+        for _ in range(size):
+            pool.put(MySQLdb.connect(
+                host=DB_HOST, user=DB_USER, passwd=DB_PASSWORD, db=DB_NAME, local_infile=1
+            ))
+    except MySQLdb.Error:
+        close_connection_pool(pool)
+        raise
+    return pool
+
+def close_connection_pool(pool: queue.Queue):
+    while not pool.empty():
+        pool.get_nowait().close()
+
+def load_fact_block(pool: queue.Queue, df: pd.DataFrame) -> int:
+    conn = pool.get()
+    try:
+        cursor = conn.cursor()
+        start_bulk_session(cursor)
+        loaded = load_data_infile(cursor, TABLES['purchase'], df)
+        conn.commit()
+        cursor.close()
+        return loaded
+    finally:
+        pool.put(conn)
+
+def load_data(chunks: Iterator[dict]):
+    try:
+        pool = open_connection_pool(POOL_SIZE)
+        conn = pool.get()
         cursor = conn.cursor()
-        setup_database(cursor)
+        cursor.execute("SET GLOBAL local_infile = 1")
+        ensure_schema(cursor)
+        if FULL_RELOAD:
+            truncate_all(cursor)
 
-        for table_key, table_name in TABLES.items():
-            df = data_dict[table_name]
-            cols = ', '.join(df.columns)
-            placeholders = ', '.join(['%s'] * len(df.columns))
-            insert_query = f"INSERT INTO {table_name} ({cols}) VALUES ({placeholders})"
-            records_to_insert = [tuple(row) for row in df.values]
+        start_bulk_session(cursor)
+        dim_loaded = {TABLES['customer']: 0, TABLES['item']: 0}
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            table_name = TABLES['purchase']
+            print(f"3. Streaming records into {table_name} and its dimensions...")
+            pending = set()
+            loaded = 0
+            for chunk in chunks:
+                # A block's new dimension rows are committed before its fact
+                # rows reach a worker, so no committed fact row can reference
+                # a customer or item that is missing from the dimensions.
+                for dim_name in dim_loaded:
+                    records_to_insert = pack_rows(chunk[dim_name], TABLE_SCHEMA[dim_name])
+                    dim_loaded[dim_name] += bulk_insert(cursor, dim_name, records_to_insert)
+                conn.commit()
+                if len(pending) == LOAD_WORKERS:
+                    # Resume parsing as soon as any worker frees up rather
+                    # than waiting on the oldest block.
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    loaded += sum(future.result() for future in done)
+                pending.add(executor.submit(load_fact_block, pool, chunk[table_name]))
+            loaded += sum(future.result() for future in pending)
+            for dim_name, dim_count in dim_loaded.items():
+                print(f"   -> {dim_name} load complete: {dim_count} records.")
+            print(f"   -> {table_name} load complete: {loaded} records.")
 
-            print(f"3. Loading {len(records_to_insert)} records into {table_name}...")
-            cursor.executemany(insert_query, records_to_insert)
-            conn.commit()
-            print(f"   -> {table_name} load complete.")
+        # The fact rows are derived from the same frame as the dimensions, so
+        # the keys are added without re-validating every row.
+        add_constraints(cursor)
+        cursor.execute("SET unique_checks = 1")
+        cursor.execute("SET foreign_key_checks = 1")
 
         print("\nSUCCESS: All data loaded and committed!")
 
-    except mysql.connector.Error as err:
+    except pa.ArrowException as err:
+        print(f"\nAn error occurred during data normalization: {err}")
+    except MySQLdb.Error as err:
         print(f"\nCRITICAL DATABASE ERROR: {err}")
     finally:
-        if 'conn' in locals() and conn.is_connected():
+        if 'cursor' in locals():
             cursor.close()
+        if 'conn' in locals():
             conn.close()
+        if 'pool' in locals():
+            close_connection_pool(pool)
 
 if __name__ == "__main__":
     normalized_data = read_and_normalize_data(RAW_DATA_PATH)